@@ -5,17 +5,55 @@ Processes natural language queries using LLM and executes appropriate tools.
 """
 
 import os
-import json
+import ast
+import atexit
+import bisect
+import hashlib
 import importlib
 import inspect
-from typing import Dict, Any, List
-from dotenv import load_dotenv
-import google.generativeai as genai
+import re
+import queue
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, Future
+from typing import Dict, Any, List, Iterable, Iterator, Optional
+from pydantic import BaseModel, ValidationError
 
-# Load environment variables  
-import os as _os
-env_path = _os.path.join(_os.getcwd(), '.env')
-load_dotenv(dotenv_path=env_path)
+# Results file templates, filled in per query
+_TIMESTAMP_FORMAT = "%Y-%m-%d %H:%M:%S"
+
+_RESPONSE_HEADER = """# Tool-Enhanced Reasoning System - Query Results
+Generated: {timestamp}
+
+## User Query:
+{user_query}
+
+## LLM Response (Raw JSON):
+{response_text}
+
+## Parsed Operations:
+"""
+
+_ERROR_REPORT = """# Tool-Enhanced Reasoning System - Error Report
+Generated: {timestamp}
+
+## User Query:
+{user_query}
+
+## Error:
+{error_message}
+
+## Status:
+Query execution failed. Please check your query and try again.
+"""
+
+def _load_env():
+    """Load environment variables from .env in the working directory."""
+    # Imported here to keep startup fast; only needed once
+    from dotenv import load_dotenv
+    
+    env_path = os.path.join(os.getcwd(), '.env')
+    load_dotenv(dotenv_path=env_path)
 
 class ToolRegistry:
     """Registry for dynamically loading and managing tools."""
@@ -33,27 +71,29 @@ class ToolRegistry:
                 module = importlib.import_module(module_name)
                 tool_name = module_name.split('.')[-1]  # e.g., 'math_tools'
                 
-                # Get all functions from the module
-                functions = {}
-                for name, obj in inspect.getmembers(module):
-                    if inspect.isfunction(obj) and not name.startswith('_'):
-                        functions[name] = obj
+                # Each tool module declares the functions it exposes
+                functions = dict(module.EXPORTS)
                 
                 self.tools[tool_name] = functions
                 print(f"✅ Loaded {len(functions)} functions from {tool_name}")
                 
-            except ImportError as e:
+            except (ImportError, AttributeError) as e:
                 print(f"❌ Failed to load {module_name}: {e}")
+        
+        # Flat dispatch table and signatures, built once for every step and prompt
+        self._flat = {(tool_name, func_name): func
+                      for tool_name, functions in self.tools.items()
+                      for func_name, func in functions.items()}
+        self._sigs = {key: str(inspect.signature(func)) for key, func in self._flat.items()}
     
     def get_function(self, tool_name: str, function_name: str):
         """Get a specific function from a tool."""
-        if tool_name not in self.tools:
-            raise ValueError(f"Tool '{tool_name}' not found")
-        
-        if function_name not in self.tools[tool_name]:
+        try:
+            return self._flat[(tool_name, function_name)]
+        except KeyError:
+            if tool_name not in self.tools:
+                raise ValueError(f"Tool '{tool_name}' not found")
             raise ValueError(f"Function '{function_name}' not found in {tool_name}")
-        
-        return self.tools[tool_name][function_name]
     
     def get_tool_descriptions(self) -> str:
         """Generate tool descriptions for LLM prompt."""
@@ -63,14 +103,29 @@ class ToolRegistry:
             descriptions.append(f"\n## {tool_name.upper()}:")
             
             for func_name, func in functions.items():
-                # Get function signature
-                sig = inspect.signature(func)
+                sig = self._sigs[(tool_name, func_name)]
                 docstring = inspect.getdoc(func) or "No description available"
                 
                 descriptions.append(f"- {func_name}{sig}: {docstring}")
         
         return "\n".join(descriptions)
 
+class Operation(BaseModel):
+    """A single tool call in an execution plan."""
+    
+    step: Optional[int] = None
+    tool: str
+    function: str
+    arguments: List[Any] = []
+    store_as: Optional[str] = None
+    description: Optional[str] = None
+
+class Plan(BaseModel):
+    """An execution plan as produced by the LLM."""
+    
+    reasoning: str = ""
+    operations: List[Operation]
+
 class StepExecutor:
     """Executes operations step by step with variable storage."""
     
@@ -78,6 +133,10 @@ class StepExecutor:
         self.tool_registry = tool_registry
         self.variables = {}
         self.execution_log = []
+        self._log_order = []  # plan position of each execution_log entry
+        self._lock = threading.Lock()
+        self._failed = threading.Event()
+        self._first_failure = None  # plan position of the earliest failed step
     
     def resolve_argument(self, arg):
         """Resolve argument - could be a value or a stored variable."""
@@ -85,14 +144,14 @@ class StepExecutor:
             return self.variables[arg]
         return arg
     
-    def execute_step(self, step: Dict[str, Any]) -> Any:
+    def execute_step(self, step: Operation, position: Optional[int] = None) -> Any:
         """Execute a single step operation."""
         try:
-            tool_name = step['tool']
-            function_name = step['function']
-            arguments = step.get('arguments', [])
-            store_as = step.get('store_as')
-            description = step.get('description', f"Execute {function_name}")
+            tool_name = step.tool
+            function_name = step.function
+            arguments = step.arguments
+            store_as = step.store_as
+            description = step.description if step.description is not None else f"Execute {function_name}"
             
             # Resolve all arguments
             resolved_args = [self.resolve_argument(arg) for arg in arguments]
@@ -101,56 +160,321 @@ class StepExecutor:
             func = self.tool_registry.get_function(tool_name, function_name)
             result = func(*resolved_args)
             
-            # Store result if needed
-            if store_as:
-                self.variables[store_as] = result
-            
-            # Log execution
-            log_entry = {
-                'step': step.get('step', len(self.execution_log) + 1),
-                'description': description,
-                'function': f"{tool_name}.{function_name}",
-                'arguments': resolved_args,
-                'result': result
-            }
-            self.execution_log.append(log_entry)
-            
-            print(f"Step {log_entry['step']}: {description}")
-            print(f"  → {function_name}({', '.join(map(str, resolved_args))}) = {result}")
+            with self._lock:
+                if position is None:
+                    position = len(self.execution_log)
+                
+                # Store result if needed
+                if store_as:
+                    self.variables[store_as] = result
+                
+                # Log execution
+                log_entry = {
+                    'step': step.step if step.step is not None else position + 1,
+                    'description': description,
+                    'function': f"{tool_name}.{function_name}",
+                    'arguments': resolved_args,
+                    'result': result
+                }
+                # Keep the log in plan order however the steps finish
+                index = bisect.bisect(self._log_order, position)
+                self._log_order.insert(index, position)
+                self.execution_log.insert(index, log_entry)
+                
+                print(f"Step {log_entry['step']}: {description}")
+                print(f"  → {function_name}({', '.join(map(str, resolved_args))}) = {result}")
             
             return result
             
         except Exception as e:
-            error_msg = f"Error in step {step.get('step', '?')}: {str(e)}"
+            if position is not None:
+                with self._lock:
+                    if self._first_failure is None or position < self._first_failure:
+                        self._first_failure = position
+                    self._failed.set()
+            error_msg = f"Error in step {step.step if step.step is not None else '?'}: {str(e)}"
             print(f"❌ {error_msg}")
             raise RuntimeError(error_msg)
     
-    def execute_operations(self, operations: List[Dict[str, Any]]) -> Any:
-        """Execute all operations in sequence."""
-        final_result = None
+    def execute_operations(self, operations: Iterable[Operation]) -> Any:
+        """Execute operations as soon as each one is available.
         
-        print(f"\n🔄 Executing {len(operations)} operation(s)...")
+        Each step only waits for the earlier steps it shares a variable with, so
+        independent steps run concurrently. Results are the same as running the
+        steps in order: after a failure no later step is started and no further
+        operations are read.
+        """
+        print(f"\n🔄 Executing operations...")
         print("-" * 50)
         
-        for operation in operations:
-            result = self.execute_step(operation)
-            final_result = result
+        futures: List[Future] = []
+        writers: Dict[str, Future] = {}       # variable -> last step storing it
+        readers: Dict[str, List[Future]] = {}  # variable -> steps reading it since
+        self._failed.clear()
+        self._first_failure = None
+        
+        with ThreadPoolExecutor() as pool:
+            for position, operation in enumerate(operations):
+                if self._failed.is_set():
+                    break
+                
+                names = {arg for arg in operation.arguments if isinstance(arg, str)}
+                store_as = operation.store_as
+                
+                # Read-after-write, plus write-after-read/write on the stored name
+                dependencies = [writers[name] for name in names if name in writers]
+                if store_as:
+                    if store_as in writers:
+                        dependencies.append(writers[store_as])
+                    dependencies.extend(readers.get(store_as, []))
+                
+                future = pool.submit(self._execute_after, dependencies, position, operation)
+                futures.append(future)
+                
+                for name in names:
+                    readers.setdefault(name, []).append(future)
+                if store_as:
+                    writers[store_as] = future
+                    readers[store_as] = []
+        
+        # Surface the first failure in plan order
+        final_result = None
+        for future in futures:
+            final_result = future.result()
         
         return final_result
+    
+    def _execute_after(self, dependencies: List[Future], position: int, step: Operation) -> Any:
+        """Wait for the steps this one depends on, then execute it unless an earlier step failed."""
+        for dependency in dependencies:
+            dependency.result()
+        with self._lock:
+            if self._failed.is_set() and self._first_failure < position:
+                return None
+        return self.execute_step(step, position)
+
+class OperationStreamParser:
+    """Incrementally extracts complete operations from a streamed JSON plan."""
+    
+    OPERATIONS_KEY = re.compile(r'"operations"\s*:\s*\[')
+    
+    def __init__(self):
+        self.text = ""
+        self.pos = None
+        self.depth = 0
+        self.in_string = False
+        self.escaped = False
+        self.object_start = None
+        self.done = False
+    
+    def feed(self, chunk: str) -> List[Operation]:
+        """Add a chunk of response text and return any newly completed operations."""
+        self.text += chunk
+        operations = []
+        
+        if self.done:
+            return operations
+        
+        if self.pos is None:
+            match = self.OPERATIONS_KEY.search(self.text)
+            if not match:
+                return operations
+            self.pos = match.end()
+        
+        # Bracket counter that skips over string contents
+        while self.pos < len(self.text):
+            char = self.text[self.pos]
+            
+            if self.in_string:
+                if self.escaped:
+                    self.escaped = False
+                elif char == "\\":
+                    self.escaped = True
+                elif char == '"':
+                    self.in_string = False
+            elif char == '"':
+                self.in_string = True
+            elif char in "{[":
+                if self.depth == 0:
+                    self.object_start = self.pos
+                self.depth += 1
+            elif char in "}]":
+                if self.depth == 0:
+                    # End of the operations array
+                    self.done = True
+                    break
+                self.depth -= 1
+                if self.depth == 0:
+                    try:
+                        operations.append(Operation.model_validate_json(self.text[self.object_start:self.pos + 1]))
+                    except ValidationError:
+                        # Leave the rest to the full parse once the response is complete
+                        self.done = True
+                        break
+            
+            self.pos += 1
+        
+        return operations
+
+class ArithmeticPlanner:
+    """Plans plain arithmetic queries locally, without calling the LLM."""
+    
+    PATTERN = re.compile(r'^[\d+\-*/().\s]+$')
+    FUNCTIONS = {
+        ast.Add: 'add',
+        ast.Sub: 'subtract',
+        ast.Mult: 'multiply',
+        ast.Div: 'divide',
+        ast.FloorDiv: 'floor_divide',
+        ast.Pow: 'power',
+    }
+    
+    def plan(self, user_query: str) -> Optional[Plan]:
+        """Return an execution plan if the query is a plain arithmetic expression, else None."""
+        query = user_query.strip()
+        if not self.PATTERN.match(query):
+            return None
+        
+        try:
+            tree = ast.parse(query, mode='eval')
+            operations = []
+            self._add_steps(tree.body, operations)
+        except (SyntaxError, ValueError, RecursionError):
+            # Very long or deeply nested expressions are left to the LLM
+            return None
+        
+        # A bare number has nothing to compute
+        if not operations:
+            return None
+        
+        return Plan(
+            reasoning="Plain arithmetic expression, planned locally following order of operations",
+            operations=operations
+        )
+    
+    def _add_steps(self, node: ast.AST, operations: List[Operation]) -> Any:
+        """Append the steps computing node and return the number or variable holding its value."""
+        if isinstance(node, ast.Constant) and type(node.value) in (int, float):
+            return node.value
+        
+        if isinstance(node, ast.UnaryOp) and isinstance(node.op, (ast.UAdd, ast.USub)):
+            operand = self._add_steps(node.operand, operations)
+            if isinstance(node.op, ast.UAdd):
+                return operand
+            if not isinstance(operand, str):
+                return -operand
+            function, arguments = 'subtract', [0, operand]
+        elif isinstance(node, ast.BinOp) and type(node.op) in self.FUNCTIONS:
+            function = self.FUNCTIONS[type(node.op)]
+            arguments = [self._add_steps(node.left, operations), self._add_steps(node.right, operations)]
+        else:
+            raise ValueError(f"Unsupported expression: {ast.unparse(node)}")
+        
+        step = len(operations) + 1
+        store_as = f"step_{step}_result"
+        operations.append(Operation(
+            step=step,
+            tool='math_tools',
+            function=function,
+            arguments=arguments,
+            store_as=store_as,
+            description=f"Calculate {ast.unparse(node)}"
+        ))
+        return store_as
+
+class ResponseFileWriter:
+    """Writes the response file from a background thread so queries never wait on disk."""
+    
+    def __init__(self, path: str = "llm_response.txt"):
+        self.path = path
+        self.pending = queue.Queue()
+        self.thread = threading.Thread(target=self._run, daemon=True)
+        self.thread.start()
+        self.closed = False
+        
+        # The thread is a daemon, so flush on interpreter exit for callers that never close()
+        atexit.register(self.close)
+    
+    def write(self, content: str):
+        """Replace the file contents."""
+        self.pending.put(("w", content))
+    
+    def append(self, content: str):
+        """Append content to the end of the file."""
+        self.pending.put(("a", content))
+    
+    def close(self):
+        """Flush all pending writes and stop the writer thread."""
+        if self.closed:
+            return
+        self.closed = True
+        atexit.unregister(self.close)
+        self.pending.put(None)
+        self.thread.join()
+    
+    def _run(self):
+        """Drain queued writes, coalescing each batch into a single file write."""
+        while True:
+            batch = [self.pending.get()]
+            while True:
+                try:
+                    batch.append(self.pending.get_nowait())
+                except queue.Empty:
+                    break
+            
+            stop = None in batch
+            if stop:
+                batch = batch[:batch.index(None)]
+            
+            if batch:
+                # Everything before the last overwrite would be discarded anyway
+                last_write = max((i for i, (mode, _) in enumerate(batch) if mode == "w"), default=None)
+                mode = "w" if last_write is not None else "a"
+                content = "".join(text for _, text in batch[last_write or 0:])
+                
+                try:
+                    with open(self.path, mode, encoding="utf-8") as f:
+                        f.write(content)
+                except Exception as e:
+                    print(f"⚠️ Failed to write to '{self.path}': {e}")
+            
+            if stop:
+                break
 
 class LLMProcessor:
     """Handles communication with Gemini LLM."""
     
-    def __init__(self, tool_registry: ToolRegistry):
+    def __init__(self, tool_registry: ToolRegistry, response_writer: ResponseFileWriter):
         self.tool_registry = tool_registry
+        self.response_writer = response_writer
         
         # Configure Gemini
-        api_key = os.getenv('GEMINI_API_KEY')
-        if not api_key:
+        self._api_key = os.getenv('GEMINI_API_KEY')
+        if not self._api_key:
             raise ValueError("GEMINI_API_KEY not found in environment variables")
+        self._model = None
+        
+        # Tools are static after loading, so build the prompt prefix once
+        self._system_prompt = self.create_system_prompt()
+        self._prompt_prefix = f"{self._system_prompt}\n\nUser Query: "
         
-        genai.configure(api_key=api_key)
-        self.model = genai.GenerativeModel('gemini-1.5-flash')
+        # Exact-match plan cache; keys include the prompt version so a changed
+        # tool set never serves plans built against the old one
+        self._prompt_version = hashlib.md5(self._system_prompt.encode()).hexdigest()
+        self._cache: Dict[str, Dict[str, Any]] = {}
+        self.arithmetic_planner = ArithmeticPlanner()
+        self.last_plan = None
+    
+    @property
+    def model(self):
+        """Gemini model, configured on first use."""
+        if self._model is None:
+            # The SDK pulls in protobuf/grpc, so it is only imported once a query needs it
+            import google.generativeai as genai
+            
+            genai.configure(api_key=self._api_key)
+            self._model = genai.GenerativeModel('gemini-1.5-flash')
+        return self._model
     
     def create_system_prompt(self) -> str:
         """Create system prompt with tool descriptions."""
@@ -208,73 +532,85 @@ Response:
   ]
 }}"""
     
-    def process_query(self, user_query: str) -> Dict[str, Any]:
-        """Process user query and return execution plan."""
-        system_prompt = self.create_system_prompt()
+    def process_query(self, user_query: str) -> Iterator[Operation]:
+        """Process user query, yielding plan operations as soon as each one is complete.
         
-        full_prompt = f"{system_prompt}\n\nUser Query: {user_query}\n\nResponse:"
+        The full plan is available as `last_plan` once the generator is exhausted.
+        """
+        self.last_plan = None
+        
+        # Plain arithmetic never needs the LLM
+        local_plan = self.arithmetic_planner.plan(user_query)
+        if local_plan is not None:
+            self.save_llm_response_to_file(user_query, "Not requested - plain arithmetic planned locally", local_plan)
+            print(f"⚡ Plain arithmetic - planned locally without the LLM")
+            print("-" * 50)
+            self.last_plan = local_plan
+            yield from local_plan.operations
+            return
+        
+        cache_key = hashlib.md5((self._prompt_version + user_query).encode()).hexdigest()
+        cached = self._cache.get(cache_key)
+        if cached is not None:
+            self.save_llm_response_to_file(user_query, cached['response_text'], cached['plan'])
+            print(f"⚡ Reusing cached plan for this query")
+            print("-" * 50)
+            self.last_plan = cached['plan']
+            yield from self.last_plan.operations
+            return
+        
+        full_prompt = f"{self._prompt_prefix}{user_query}\n\nResponse:"
         
         try:
-            response = self.model.generate_content(full_prompt)
-            response_text = response.text.strip()
+            # Stream the response so early steps can run while later ones are generated
+            response = self.model.generate_content(full_prompt, stream=True)
+            parser = OperationStreamParser()
+            streamed = 0
             
-            # Save LLM response to file (will be cleared for each new prompt)
-            self.save_llm_response_to_file(user_query, response_text)
+            for chunk in response:
+                for operation in parser.feed(chunk.text):
+                    streamed += 1
+                    yield operation
             
-            print(f"🤖 LLM Response saved to 'llm_response.txt'")
-            print("-" * 50)
+            response_text = parser.text.strip()
             
-            # Parse JSON response (handle markdown formatting)
+            # Parse and validate JSON response (handle markdown formatting)
             try:
-                # Remove markdown code blocks if present
-                if response_text.startswith("```json"):
-                    response_text = response_text.replace("```json", "").replace("```", "").strip()
-                elif response_text.startswith("```"):
-                    response_text = response_text.replace("```", "").strip()
+                # Remove markdown code fences if present (they only ever wrap the JSON)
+                json_text = response_text.removeprefix("```json").removeprefix("```").removesuffix("```").strip()
                 
-                return json.loads(response_text)
-            except json.JSONDecodeError as e:
-                print(f"🔍 Debug - Raw response: {repr(response_text)}")
-                raise ValueError(f"Invalid JSON response from LLM: {e}")
+                plan = Plan.model_validate_json(json_text)
+            except ValidationError as e:
+                print(f"🔍 Debug - Raw response: {repr(json_text)}")
+                raise ValueError(f"Invalid plan from LLM: {e}")
+            
+            # Save LLM response to file (will be cleared for each new prompt)
+            self.save_llm_response_to_file(user_query, response_text, plan)
+            
+            print(f"🤖 LLM Response saved to 'llm_response.txt'")
+            print("-" * 50)
                 
         except Exception as e:
             raise RuntimeError(f"Failed to get response from LLM: {e}")
-    
-    def save_llm_response_to_file(self, user_query: str, response_text: str):
-        """Save LLM response and query details to file."""
-        from datetime import datetime
         
-        timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        self._cache[cache_key] = {'response_text': response_text, 'plan': plan}
+        self.last_plan = plan
         
-        content = f"""# Tool-Enhanced Reasoning System - Query Results
-Generated: {timestamp}
-
-## User Query:
-{user_query}
-
-## LLM Response (Raw JSON):
-{response_text}
-
-## Parsed Operations:
-"""
+        # Anything the stream parser could not pick up early
+        yield from plan.operations[streamed:]
+    
+    def save_llm_response_to_file(self, user_query: str, response_text: str, plan: Plan):
+        """Save LLM response, its parsed plan and query details to file."""
+        content = _RESPONSE_HEADER.format(
+            timestamp=time.strftime(_TIMESTAMP_FORMAT),
+            user_query=user_query,
+            response_text=response_text
+        )
         
-        try:
-            # Try to parse and format the JSON nicely
-            if response_text.startswith("```json"):
-                json_text = response_text.replace("```json", "").replace("```", "").strip()
-            elif response_text.startswith("```"):
-                json_text = response_text.replace("```", "").strip()
-            else:
-                json_text = response_text
-            
-            parsed_json = json.loads(json_text)
-            content += json.dumps(parsed_json, indent=2)
-        except:
-            content += "Failed to parse JSON"
+        content += plan.model_dump_json(indent=2, exclude_unset=True)
         
         # Write to file (overwrites previous content)
-        with open("llm_response.txt", "w", encoding="utf-8") as f:
-            f.write(content)
+        self.response_writer.write(content)
 
 class ToolEnhancedReasoning:
     """Main orchestrator for the tool-enhanced reasoning system."""
@@ -282,7 +618,8 @@ class ToolEnhancedReasoning:
     def __init__(self):
         print("🚀 Initializing Tool-Enhanced Reasoning System...")
         self.tool_registry = ToolRegistry()
-        self.llm_processor = LLMProcessor(self.tool_registry)
+        self.response_writer = ResponseFileWriter("llm_response.txt")
+        self.llm_processor = LLMProcessor(self.tool_registry, self.response_writer)
         print("✅ System ready!")
     
     def process_query(self, user_query: str):
@@ -291,16 +628,10 @@ class ToolEnhancedReasoning:
         print("=" * 60)
         
         try:
-            # Get execution plan from LLM
-            plan = self.llm_processor.process_query(user_query)
-            
-            # Validate plan structure
-            if 'operations' not in plan:
-                raise ValueError("Invalid plan: missing 'operations' field")
-            
-            # Execute the plan
+            # Execute the plan while the LLM is still streaming it
             executor = StepExecutor(self.tool_registry)
-            final_result = executor.execute_operations(plan['operations'])
+            final_result = executor.execute_operations(self.llm_processor.process_query(user_query))
+            plan = self.llm_processor.last_plan
             
             # Save execution results to file
             self.save_execution_results_to_file(user_query, plan, executor, final_result)
@@ -324,15 +655,11 @@ class ToolEnhancedReasoning:
             self.save_error_to_file(user_query, str(e))
             return None
     
-    def save_execution_results_to_file(self, user_query: str, plan: Dict[str, Any], executor: 'StepExecutor', final_result: Any):
+    def save_execution_results_to_file(self, user_query: str, plan: Plan, executor: 'StepExecutor', final_result: Any):
         """Append execution results to the response file."""
         try:
-            # Read existing content
-            with open("llm_response.txt", "r", encoding="utf-8") as f:
-                content = f.read()
-            
             # Append execution details
-            content += f"\n\n## Execution Results:\n"
+            content = f"\n\n## Execution Results:\n"
             content += f"**Final Result:** {final_result}\n\n"
             
             if executor.execution_log:
@@ -350,66 +677,55 @@ class ToolEnhancedReasoning:
                     content += f"- **{var_name}:** {var_value}\n"
                 content += "\n"
             
-            # Write back to file
-            with open("llm_response.txt", "w", encoding="utf-8") as f:
-                f.write(content)
+            self.response_writer.append(content)
                 
         except Exception as e:
             print(f"⚠️ Failed to save execution results to file: {e}")
     
     def save_error_to_file(self, user_query: str, error_message: str):
         """Save error information to file."""
-        from datetime import datetime
-        
-        timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        
-        content = f"""# Tool-Enhanced Reasoning System - Error Report
-Generated: {timestamp}
-
-## User Query:
-{user_query}
-
-## Error:
-{error_message}
-
-## Status:
-Query execution failed. Please check your query and try again.
-"""
+        content = _ERROR_REPORT.format(
+            timestamp=time.strftime(_TIMESTAMP_FORMAT),
+            user_query=user_query,
+            error_message=error_message
+        )
         
-        try:
-            with open("llm_response.txt", "w", encoding="utf-8") as f:
-                f.write(content)
-        except Exception as e:
-            print(f"⚠️ Failed to save error to file: {e}")
+        self.response_writer.write(content)
     
     def interactive_mode(self):
         """Run in interactive mode."""
         print(f"\n🎮 Interactive Mode - Type 'quit' to exit")
         print("=" * 60)
         
-        while True:
-            try:
-                query = input("\n💬 Enter your query: ").strip()
-                
-                if query.lower() in ['quit', 'exit', 'q']:
-                    print("👋 Goodbye!")
+        try:
+            while True:
+                try:
+                    query = input("\n💬 Enter your query: ").strip()
+                    
+                    if query.lower() in ['quit', 'exit', 'q']:
+                        print("👋 Goodbye!")
+                        break
+                    
+                    if not query:
+                        print("Please enter a valid query.")
+                        continue
+                    
+                    self.process_query(query)
+                    
+                except KeyboardInterrupt:
+                    print("\n👋 Goodbye!")
                     break
-                
-                if not query:
-                    print("Please enter a valid query.")
-                    continue
-                
-                self.process_query(query)
-                
-            except KeyboardInterrupt:
-                print("\n👋 Goodbye!")
-                break
-            except Exception as e:
-                print(f"❌ Unexpected error: {e}")
+                except Exception as e:
+                    print(f"❌ Unexpected error: {e}")
+        finally:
+            # Make sure the last results reach the file before exiting
+            self.response_writer.close()
 
 def main():
     """Main entry point."""
     try:
+        _load_env()
+        
         # Initialize the system
         reasoning_system = ToolEnhancedReasoning()
         
@@ -1,10 +1,35 @@
 # Math utility functions
 import math
+import operator as _op
 import statistics
+import numpy as np
+
+# Degree/radian conversion factors, so trig tools make a single math call
+_DEG2RAD = math.pi / 180
+_RAD2DEG = 180 / math.pi
+
+# Lists at least this long are handed to NumPy instead of pure-Python loops
+_NUMPY_MIN_SIZE = 32
+
+def _numeric_array(args):
+    """Return args as a NumPy array if there are enough plain numbers to vectorize, else None."""
+    if len(args) < _NUMPY_MIN_SIZE:
+        return None
+    try:
+        values = np.asarray(args)
+    except ValueError:
+        # Ragged nested lists; let the pure-Python path raise its usual error
+        return None
+    # Nested lists must keep their TypeError rather than being flattened
+    return values if values.ndim == 1 and values.dtype.kind in "biuf" else None
 
 # Basic arithmetic operations
 def add(*args):
     """Add multiple numbers."""
+    if len(args) == 2:
+        # Plans almost always add exactly two values; starting from 0 like sum()
+        # keeps rejecting strings and lists, e.g. names of variables never stored
+        return 0 + args[0] + args[1]
     if not args:
         return 0
     return sum(args)
@@ -15,6 +40,8 @@ def subtract(a, b):
 
 def multiply(*args):
     """Multiply multiple numbers."""
+    if len(args) == 2:
+        return args[0] * args[1]
     if not args:
         return 0
     result = 1
@@ -86,12 +113,18 @@ def mean(*args):
     """Calculate arithmetic mean of multiple numbers."""
     if not args:
         raise ValueError("Cannot calculate mean of empty list")
+    values = _numeric_array(args)
+    if values is not None:
+        return float(np.mean(values))
     return statistics.mean(args)
 
 def median(*args):
     """Calculate median of multiple numbers."""
     if not args:
         raise ValueError("Cannot calculate median of empty list")
+    values = _numeric_array(args)
+    if values is not None:
+        return float(np.median(values))
     return statistics.median(args)
 
 def mode(*args):
@@ -113,12 +146,18 @@ def variance(*args):
     """Calculate variance of multiple numbers."""
     if len(args) < 2:
         raise ValueError("Need at least 2 values to calculate variance")
+    values = _numeric_array(args)
+    if values is not None:
+        return float(np.var(values, ddof=1))
     return statistics.variance(args)
 
 def standard_deviation(*args):
     """Calculate standard deviation of multiple numbers."""
     if len(args) < 2:
         raise ValueError("Need at least 2 values to calculate standard deviation")
+    values = _numeric_array(args)
+    if values is not None:
+        return float(np.std(values, ddof=1))
     return statistics.stdev(args)
 
 # Advanced math functions
@@ -138,6 +177,9 @@ def gcd(*args):
     """Calculate greatest common divisor of multiple numbers."""
     if not args:
         raise ValueError("Cannot calculate GCD of empty list")
+    values = _numeric_array(args)
+    if values is not None and values.dtype.kind in "iu":
+        return int(np.gcd.reduce(values))
     result = args[0]
     for num in args[1:]:
         result = math.gcd(result, num)
@@ -167,31 +209,31 @@ def percentage_change(old_value, new_value):
 # Trigonometric functions
 def sin(angle_degrees):
     """Calculate sine of angle in degrees."""
-    return math.sin(math.radians(angle_degrees))
+    return math.sin(angle_degrees * _DEG2RAD)
 
 def cos(angle_degrees):
     """Calculate cosine of angle in degrees."""
-    return math.cos(math.radians(angle_degrees))
+    return math.cos(angle_degrees * _DEG2RAD)
 
 def tan(angle_degrees):
     """Calculate tangent of angle in degrees."""
-    return math.tan(math.radians(angle_degrees))
+    return math.tan(angle_degrees * _DEG2RAD)
 
 def asin(value):
     """Calculate arcsine in degrees."""
     if value < -1 or value > 1:
         raise ValueError("Value must be between -1 and 1")
-    return math.degrees(math.asin(value))
+    return math.asin(value) * _RAD2DEG
 
 def acos(value):
     """Calculate arccosine in degrees."""
     if value < -1 or value > 1:
         raise ValueError("Value must be between -1 and 1")
-    return math.degrees(math.acos(value))
+    return math.acos(value) * _RAD2DEG
 
 def atan(value):
     """Calculate arctangent in degrees."""
-    return math.degrees(math.atan(value))
+    return math.atan(value) * _RAD2DEG
 
 # Logarithmic functions
 def log(n, base=math.e):
@@ -288,22 +330,27 @@ def not_equal_to(a, b):
     """Check if a is not equal to b."""
     return a != b
 
+# Operators accepted by compare, including the Unicode forms LLMs like to emit
+_COMPARISONS = {
+    ">": _op.gt,
+    "<": _op.lt,
+    "==": _op.eq,
+    "=": _op.eq,
+    ">=": _op.ge,
+    "≥": _op.ge,
+    "<=": _op.le,
+    "≤": _op.le,
+    "!=": _op.ne,
+    "≠": _op.ne,
+}
+
 def compare(a, b, operator):
     """Compare two values using specified operator."""
-    if operator == ">":
-        return a > b
-    elif operator == "<":
-        return a < b
-    elif operator == "==" or operator == "=":
-        return a == b
-    elif operator == ">=" or operator == "≥":
-        return a >= b
-    elif operator == "<=" or operator == "≤":
-        return a <= b
-    elif operator == "!=" or operator == "≠":
-        return a != b
-    else:
+    try:
+        comparison = _COMPARISONS[operator]
+    except (KeyError, TypeError):
         raise ValueError(f"Unknown operator: {operator}")
+    return comparison(a, b)
 
 # Number properties
 def is_even(n):
@@ -314,18 +361,66 @@ def is_odd(n):
     """Check if number is odd."""
     return n % 2 != 0
 
+# Odd primes below 1000, used to screen out most composites up front
+_SMALL_PRIMES = [p for p in range(3, 1000, 2) if all(p % d for d in range(3, int(p ** 0.5) + 1, 2))]
+
+# Above _MILLER_RABIN_MIN, Miller-Rabin beats trial division. With the primes up
+# to 41 as witnesses it is exact for every n below _MILLER_RABIN_MAX (about 3.3e24,
+# the smallest strong pseudoprime to all of them). Beyond that a failed round still
+# proves n composite, so every prime below 1000 is tried as a witness and only n
+# passing them all is confirmed by trial division
+_MILLER_RABIN_MIN = 10 ** 7
+_MILLER_RABIN_MAX = 3317044064679887385961981
+_MILLER_RABIN_WITNESSES = (2, 3, 5, 7, 11, 13, 17, 19, 23, 29, 31, 37, 41)
+_MILLER_RABIN_EXTRA_WITNESSES = (2, *_SMALL_PRIMES)
+
+def _trial_division(n):
+    """Check n (coprime to 6) for 6k±1 divisors up to its square root."""
+    for i in range(5, int(math.sqrt(n)) + 1, 6):
+        if n % i == 0 or n % (i + 2) == 0:
+            return False
+    return True
+
+def _miller_rabin(n, witnesses=_MILLER_RABIN_WITNESSES):
+    """Miller-Rabin test for odd n with no prime factor below 1000."""
+    d, s = n - 1, 0
+    while d % 2 == 0:
+        d //= 2
+        s += 1
+    
+    for a in witnesses:
+        x = pow(a, d, n)
+        if x == 1 or x == n - 1:
+            continue
+        for _ in range(s - 1):
+            x = pow(x, 2, n)
+            if x == n - 1:
+                break
+        else:
+            return False
+    return True
+
 def is_prime(n):
     """Check if number is prime."""
+    if isinstance(n, float) and n.is_integer():
+        n = int(n)
     if n < 2:
         return False
     if n == 2:
         return True
     if n % 2 == 0:
         return False
-    for i in range(3, int(math.sqrt(n)) + 1, 2):
-        if n % i == 0:
+    for p in _SMALL_PRIMES:
+        if n % p == 0:
+            return n == p
+    if n < 1000 * 1000:
+        return True
+    if isinstance(n, int) and n > _MILLER_RABIN_MIN:
+        if n < _MILLER_RABIN_MAX:
+            return _miller_rabin(n)
+        if not _miller_rabin(n, _MILLER_RABIN_EXTRA_WITNESSES):
             return False
-    return True
+    return _trial_division(n)
 
 def is_positive(n):
     """Check if number is positive."""
@@ -337,4 +432,66 @@ def is_negative(n):
 
 def is_zero(n):
     """Check if number is zero."""
-    return n == 0 
\ No newline at end of file
+    return n == 0
+
+
+# Tools exposed to the LLM, in the order they appear in the system prompt
+EXPORTS = {
+    'add': add,
+    'subtract': subtract,
+    'multiply': multiply,
+    'divide': divide,
+    'modulo': modulo,
+    'floor_divide': floor_divide,
+    'power': power,
+    'square': square,
+    'cube': cube,
+    'square_root': square_root,
+    'cube_root': cube_root,
+    'nth_root': nth_root,
+    'average': average,
+    'mean': mean,
+    'median': median,
+    'mode': mode,
+    'range_values': range_values,
+    'variance': variance,
+    'standard_deviation': standard_deviation,
+    'absolute': absolute,
+    'factorial': factorial,
+    'gcd': gcd,
+    'lcm': lcm,
+    'percentage': percentage,
+    'percentage_change': percentage_change,
+    'sin': sin,
+    'cos': cos,
+    'tan': tan,
+    'asin': asin,
+    'acos': acos,
+    'atan': atan,
+    'log': log,
+    'log10': log10,
+    'log2': log2,
+    'natural_log': natural_log,
+    'exp': exp,
+    'exp2': exp2,
+    'exp10': exp10,
+    'round_number': round_number,
+    'ceiling': ceiling,
+    'floor': floor,
+    'truncate': truncate,
+    'minimum': minimum,
+    'maximum': maximum,
+    'greater_than': greater_than,
+    'less_than': less_than,
+    'equal_to': equal_to,
+    'greater_than_or_equal': greater_than_or_equal,
+    'less_than_or_equal': less_than_or_equal,
+    'not_equal_to': not_equal_to,
+    'compare': compare,
+    'is_even': is_even,
+    'is_odd': is_odd,
+    'is_prime': is_prime,
+    'is_positive': is_positive,
+    'is_negative': is_negative,
+    'is_zero': is_zero,
+}
@@ -1,33 +1,178 @@
 # String utility functions
+import os
 import re
 import string
+from collections import Counter
+from functools import lru_cache
+from itertools import filterfalse, repeat
+from operator import itemgetter
+import numpy as np
+
+try:
+    import re2 as _re2
+except ImportError:
+    _re2 = None
+
+# Set STRING_TOOLS_RE2=0 to validate with the standard re engine only
+if os.getenv('STRING_TOOLS_RE2', '1') == '0':
+    _re2 = None
+
+# Validator patterns, compiled once at import
+_EMAIL_RE = re.compile(r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$')
+_PHONE_RE = re.compile(r'^\+?1?-?\.?\s?\(?(\d{3})\)?[-.\s]?(\d{3})[-.\s]?(\d{4})$')
+_URL_RE = re.compile(r'^https?://(?:[-\w.])+(?:[:\d]+)?(?:/(?:[\w/_.])*(?:\?(?:[\w&=%.])*)?(?:#(?:\w)*)?)$')
+
+# From this length on, ASCII input is validated with RE2, whose linear-time
+# matching avoids re's backtracking blowup (e.g. long digit runs in a URL host);
+# shorter input stays on re, which has far less per-call overhead
+_RE2_MIN_LENGTH = 256
+
+_ASCII_SPACE = r'\t\n\v\f\r\x1c-\x1f '
+_RE_CLASS_OR_SPACE = re.compile(r'\[[^\]]*\]|\\s')
+
+def _spell_out_space(match):
+    """Expand \\s to re's ASCII whitespace set, inside or outside a character class."""
+    token = match.group()
+    if token == r'\s':
+        return f'[{_ASCII_SPACE}]'
+    return token.replace(r'\s', _ASCII_SPACE)
+
+def _compile_re2(regex):
+    """Compile regex for RE2 so it matches ASCII text exactly like re, or None without RE2."""
+    if _re2 is None:
+        return None
+    # re's \s also covers \v and \x1c-\x1f, and its $ allows one trailing newline
+    pattern = _RE_CLASS_OR_SPACE.sub(_spell_out_space, regex.pattern)
+    return _re2.compile(pattern[:-1] + r'\n?\z')
+
+_EMAIL_RE2 = _compile_re2(_EMAIL_RE)
+_PHONE_RE2 = _compile_re2(_PHONE_RE)
+_URL_RE2 = _compile_re2(_URL_RE)
+
+def _validate(regex, regex_re2, text):
+    """Match an anchored validator pattern, using RE2 for long ASCII text when available."""
+    # \w, \d and \s are ASCII-only in RE2, so non-ASCII text always goes to re
+    if regex_re2 is not None and len(text) >= _RE2_MIN_LENGTH and text.isascii():
+        return regex_re2.match(text) is not None
+    return regex.match(text) is not None
+
+_VOWELS = "aeiouAEIOU"
+_CONSONANTS = "bcdfghjklmnpqrstvwxyzBCDFGHJKLMNPQRSTVWXYZ"
+_SENTENCE_ENDINGS = ".!?"
+
+def _ascii_complement(is_member):
+    """Return every ASCII byte failing is_member, as a bytes.translate deletion table."""
+    return bytes(b for b in range(128) if not is_member(chr(b)))
+
+_NOT_VOWELS = _ascii_complement(_VOWELS.__contains__)
+_NOT_CONSONANTS = _ascii_complement(_CONSONANTS.__contains__)
+_NOT_PUNCTUATION = _ascii_complement(string.punctuation.__contains__)
+_NOT_SENTENCE_ENDINGS = _ascii_complement(_SENTENCE_ENDINGS.__contains__)
+
+# Unicode-aware classes agree with these tables on ASCII text
+_NOT_LETTERS = _ascii_complement(str.isalpha)
+_NOT_DIGITS = _ascii_complement(str.isdigit)
+_NOT_UPPERCASE = _ascii_complement(str.isupper)
+_NOT_LOWERCASE = _ascii_complement(str.islower)
+_NOT_WHITESPACE = _ascii_complement(str.isspace)
+_NOT_ALPHANUMERIC = _ascii_complement(str.isalnum)
+
+# Deletion tables for the remove_* tools
+_DIGIT_BYTES = string.digits.encode('ascii')
+_LETTER_BYTES = string.ascii_letters.encode('ascii')
+_PUNCTUATION_TABLE = str.maketrans('', '', string.punctuation)
+
+# Classes reported by character_statistics, named after the matching count_* tool
+_CHARACTER_CLASSES = {
+    'vowels': _VOWELS.__contains__,
+    'consonants': _CONSONANTS.__contains__,
+    'letters': str.isalpha,
+    'digits': str.isdigit,
+    'uppercase_letters': str.isupper,
+    'lowercase_letters': str.islower,
+    'punctuation': string.punctuation.__contains__,
+    'whitespace': str.isspace,
+    'sentences': _SENTENCE_ENDINGS.__contains__,
+}
+
+# Row k flags the ASCII codes in class k, so one byte histogram yields every count
+_ASCII_CLASS_MATRIX = np.array(
+    [[is_member(chr(b)) for b in range(128)] for is_member in _CHARACTER_CLASSES.values()],
+    dtype=np.int64
+)
+
+def _count_ascii_class(text, complement):
+    """Count characters of an ASCII-only class by deleting everything else in C."""
+    return len(text.encode('ascii', 'ignore').translate(None, complement))
+
+def _delete_ascii(text, table):
+    """Delete the bytes in table from ASCII-only text in one C pass."""
+    return text.encode('ascii').translate(None, table).decode('ascii')
+
+# From this many ASCII characters on, a vectorized NumPy range check beats translate
+_NUMPY_MIN_LENGTH = 16384
+
+def _count_ascii_range(text, first, size):
+    """Count ASCII characters with codes in [first, first + size) for ASCII-only text."""
+    codes = np.frombuffer(text.encode('ascii'), np.uint8)
+    # Unsigned wraparound folds both bounds into one comparison per byte
+    return int(np.count_nonzero((codes - np.uint8(first)) < size))
+
+# Scanning ASCII text for one character with NumPy beats a str.find loop from here on
+_NUMPY_FIND_MIN_LENGTH = 2048
+
+# str is immutable and hashes by value, so equal texts safely share one split
+@lru_cache(maxsize=256)
+def _split_cached(text):
+    """Split text on whitespace once; repeated calls for the same text reuse the tuple."""
+    return tuple(text.split())
+
+# ASCII bytes that str.split() treats as separators
+_ASCII_SPACE_MASK = np.array([chr(b).isspace() for b in range(128)])
+
+def _ascii_word_spans(text):
+    """Return start offsets and lengths of the words in ASCII-only text, without splitting it."""
+    codes = np.frombuffer(text.encode('ascii'), np.uint8)
+    # +1 where a space run starts (a word ends), -1 where a word starts
+    edges = np.diff(_ASCII_SPACE_MASK[codes].view(np.int8), prepend=np.int8(1), append=np.int8(1))
+    starts = np.flatnonzero(edges == -1)
+    return starts, np.flatnonzero(edges == 1) - starts
+
+def _word_at(text, starts, lengths, index):
+    """Slice the word at index out of text using _ascii_word_spans output."""
+    start = int(starts[index])
+    return text[start:start + int(lengths[index])]
 
 # Character counting functions
 def count_vowels(text):
     """Count the number of vowels in text."""
     if not text:
         return 0
-    vowels = "aeiouAEIOU"
-    return sum(1 for char in text if char in vowels)
+    return _count_ascii_class(text, _NOT_VOWELS)
 
 def count_consonants(text):
     """Count the number of consonants in text."""
     if not text:
         return 0
-    consonants = "bcdfghjklmnpqrstvwxyzBCDFGHJKLMNPQRSTVWXYZ"
-    return sum(1 for char in text if char in consonants)
+    return _count_ascii_class(text, _NOT_CONSONANTS)
 
 def count_letters(text):
     """Count the number of letters in text."""
     if not text:
         return 0
-    return sum(1 for char in text if char.isalpha())
+    if text.isascii():
+        return _count_ascii_class(text, _NOT_LETTERS)
+    return sum(map(str.isalpha, text))
 
 def count_digits(text):
     """Count the number of digits in text."""
     if not text:
         return 0
-    return sum(1 for char in text if char.isdigit())
+    if text.isascii():
+        if len(text) >= _NUMPY_MIN_LENGTH:
+            return _count_ascii_range(text, 0x30, 10)
+        return _count_ascii_class(text, _NOT_DIGITS)
+    return sum(map(str.isdigit, text))
 
 def count_words(text):
     """Count the number of words in text."""
@@ -39,8 +184,10 @@ def count_sentences(text):
     """Count the number of sentences in text."""
     if not text:
         return 0
-    sentence_endings = '.!?'
-    return sum(1 for char in text if char in sentence_endings)
+    if text.isascii():
+        return _count_ascii_class(text, _NOT_SENTENCE_ENDINGS)
+    # Three C-level counts beat encoding wide text down to its ASCII bytes
+    return text.count('.') + text.count('!') + text.count('?')
 
 def count_paragraphs(text):
     """Count the number of paragraphs in text."""
@@ -71,25 +218,49 @@ def count_uppercase_letters(text):
     """Count uppercase letters in text."""
     if not text:
         return 0
-    return sum(1 for char in text if char.isupper())
+    if text.isascii():
+        if len(text) >= _NUMPY_MIN_LENGTH:
+            return _count_ascii_range(text, 0x41, 26)
+        return _count_ascii_class(text, _NOT_UPPERCASE)
+    return sum(map(str.isupper, text))
 
 def count_lowercase_letters(text):
     """Count lowercase letters in text."""
     if not text:
         return 0
-    return sum(1 for char in text if char.islower())
+    if text.isascii():
+        if len(text) >= _NUMPY_MIN_LENGTH:
+            return _count_ascii_range(text, 0x61, 26)
+        return _count_ascii_class(text, _NOT_LOWERCASE)
+    return sum(map(str.islower, text))
 
 def count_punctuation(text):
     """Count punctuation marks in text."""
     if not text:
         return 0
-    return sum(1 for char in text if char in string.punctuation)
+    return _count_ascii_class(text, _NOT_PUNCTUATION)
 
 def count_whitespace(text):
     """Count whitespace characters in text."""
     if not text:
         return 0
-    return sum(1 for char in text if char.isspace())
+    if text.isascii():
+        return _count_ascii_class(text, _NOT_WHITESPACE)
+    return sum(map(str.isspace, text))
+
+def character_statistics(text):
+    """Count vowels, consonants, letters, digits, cases, punctuation, whitespace and sentences in one pass (returns dictionary)."""
+    if not text:
+        return dict.fromkeys(_CHARACTER_CLASSES, 0)
+    if text.isascii():
+        histogram = np.bincount(np.frombuffer(text.encode('ascii'), np.uint8), minlength=128)
+        return dict(zip(_CHARACTER_CLASSES, (_ASCII_CLASS_MATRIX @ histogram).tolist()))
+    # Classify each distinct character once, weighted by how often it occurs
+    histogram = Counter(text)
+    return {
+        name: sum(count for char, count in histogram.items() if is_member(char))
+        for name, is_member in _CHARACTER_CLASSES.items()
+    }
 
 # Case conversion functions
 def uppercase(s):
@@ -117,22 +288,20 @@ def camel_case(s):
     words = s.split()
     if not words:
         return s
-    return words[0].lower() + ''.join(word.capitalize() for word in words[1:])
+    return words[0].lower() + ''.join(map(str.capitalize, words[1:]))
 
 def pascal_case(s):
     """Convert to PascalCase."""
-    words = s.split()
-    return ''.join(word.capitalize() for word in words)
+    return ''.join(map(str.capitalize, s.split()))
 
 def snake_case(s):
     """Convert to snake_case."""
-    # Replace spaces with underscores and convert to lowercase
-    return re.sub(r'\s+', '_', s.strip()).lower()
+    # split() drops surrounding whitespace and collapses runs in one C pass
+    return '_'.join(s.split()).lower()
 
 def kebab_case(s):
     """Convert to kebab-case."""
-    # Replace spaces with hyphens and convert to lowercase
-    return re.sub(r'\s+', '-', s.strip()).lower()
+    return '-'.join(s.split()).lower()
 
 # String manipulation functions
 def reverse_string(s):
@@ -141,7 +310,9 @@ def reverse_string(s):
 
 def reverse_words(s):
     """Reverse the order of words in a string."""
-    return ' '.join(s.split()[::-1])
+    words = s.split()
+    words.reverse()
+    return ' '.join(words)
 
 def remove_spaces(s):
     """Remove all spaces from string."""
@@ -149,7 +320,7 @@ def remove_spaces(s):
 
 def remove_whitespace(s):
     """Remove all whitespace characters from string."""
-    return re.sub(r'\s+', '', s)
+    return ''.join(s.split())
 
 def trim_whitespace(s):
     """Remove leading and trailing whitespace."""
@@ -157,51 +328,71 @@ def trim_whitespace(s):
 
 def compress_whitespace(s):
     """Replace multiple whitespace characters with single space."""
-    return re.sub(r'\s+', ' ', s.strip())
+    return ' '.join(s.split())
 
 def remove_punctuation(s):
     """Remove all punctuation from string."""
-    return s.translate(str.maketrans('', '', string.punctuation))
+    return s.translate(_PUNCTUATION_TABLE)
 
 def remove_digits(s):
     """Remove all digits from string."""
-    return ''.join(char for char in s if not char.isdigit())
+    if s.isascii():
+        return _delete_ascii(s, _DIGIT_BYTES)
+    return ''.join(filterfalse(str.isdigit, s))
 
 def remove_letters(s):
     """Remove all letters from string."""
-    return ''.join(char for char in s if not char.isalpha())
+    if s.isascii():
+        return _delete_ascii(s, _LETTER_BYTES)
+    return ''.join(filterfalse(str.isalpha, s))
 
 def keep_only_letters(s):
     """Keep only letters in string."""
-    return ''.join(char for char in s if char.isalpha())
+    if s.isascii():
+        return _delete_ascii(s, _NOT_LETTERS)
+    return ''.join(filter(str.isalpha, s))
 
 def keep_only_digits(s):
     """Keep only digits in string."""
-    return ''.join(char for char in s if char.isdigit())
+    if s.isascii():
+        return _delete_ascii(s, _NOT_DIGITS)
+    return ''.join(filter(str.isdigit, s))
 
 def keep_only_alphanumeric(s):
     """Keep only letters and digits."""
-    return ''.join(char for char in s if char.isalnum())
+    if s.isascii():
+        return _delete_ascii(s, _NOT_ALPHANUMERIC)
+    return ''.join(filter(str.isalnum, s))
 
 # String analysis functions
 def is_palindrome(s):
     """Check if string is a palindrome."""
-    cleaned = ''.join(char.lower() for char in s if char.isalnum())
+    if s.isascii():
+        cleaned = s.encode('ascii').translate(None, _NOT_ALPHANUMERIC).lower()
+    else:
+        cleaned = ''.join(char.lower() for char in s if char.isalnum())
     return cleaned == cleaned[::-1]
 
 def is_anagram(s1, s2):
     """Check if two strings are anagrams."""
-    clean_s1 = ''.join(char.lower() for char in s1 if char.isalpha())
-    clean_s2 = ''.join(char.lower() for char in s2 if char.isalpha())
-    return sorted(clean_s1) == sorted(clean_s2)
+    if s1.isascii() and s2.isascii():
+        clean_s1 = s1.encode('ascii').translate(None, _NOT_LETTERS).lower()
+        clean_s2 = s2.encode('ascii').translate(None, _NOT_LETTERS).lower()
+    else:
+        clean_s1 = ''.join(char.lower() for char in s1 if char.isalpha())
+        clean_s2 = ''.join(char.lower() for char in s2 if char.isalpha())
+    # Letter histograms are O(n), unlike sorting both strings
+    return len(clean_s1) == len(clean_s2) and Counter(clean_s1) == Counter(clean_s2)
 
 def is_all_uppercase(s):
     """Check if all letters in string are uppercase."""
-    return s.isupper() and any(char.isalpha() for char in s)
+    # Cased ASCII characters are letters; beyond ASCII, isupper() also accepts
+    # cased non-letters such as 'Ⅻ', so a letter must still be confirmed
+    return s.isupper() and (s.isascii() or any(map(str.isalpha, s)))
 
 def is_all_lowercase(s):
     """Check if all letters in string are lowercase."""
-    return s.islower() and any(char.isalpha() for char in s)
+    return s.islower() and (s.isascii() or any(map(str.isalpha, s)))
 
 def is_title_case(s):
     """Check if string is in title case."""
@@ -238,6 +429,9 @@ def find_substring(text, substring):
 
 def find_all_substrings(text, substring):
     """Find all occurrences of substring (returns list of indices)."""
+    if len(substring) == 1 and len(text) >= _NUMPY_FIND_MIN_LENGTH and text.isascii() and substring.isascii():
+        codes = np.frombuffer(text.encode('ascii'), np.uint8)
+        return np.flatnonzero(codes == ord(substring)).tolist()
     indices = []
     start = 0
     while True:
@@ -269,12 +463,13 @@ def remove_substring(text, substring):
 # String extraction functions
 def get_first_word(text):
     """Get the first word from text."""
-    words = text.split()
+    # Only the leading word is split off, so the rest of the text is never tokenized
+    words = text.split(None, 1)
     return words[0] if words else ""
 
 def get_last_word(text):
     """Get the last word from text."""
-    words = text.split()
+    words = text.rsplit(None, 1)
     return words[-1] if words else ""
 
 def get_word_at_position(text, position):
@@ -293,11 +488,13 @@ def get_substring(text, start, end):
 
 def get_characters_at_positions(text, positions):
     """Get characters at specified positions."""
-    result = ""
-    for pos in positions:
-        if 0 <= pos < len(text):
-            result += text[pos]
-    return result
+    n = len(text)
+    valid = [pos for pos in positions if 0 <= pos < n]
+    if not valid:
+        return ""
+    if len(valid) == 1:
+        return text[valid[0]]
+    return ''.join(itemgetter(*valid)(text))
 
 # String formatting functions
 def repeat_string(text, times):
@@ -329,82 +526,195 @@ def pad_right(text, width, pad_char='0'):
 # Advanced string operations
 def longest_word(text):
     """Find the longest word in text."""
-    words = text.split()
+    if len(text) >= _NUMPY_MIN_LENGTH and text.isascii():
+        starts, lengths = _ascii_word_spans(text)
+        return _word_at(text, starts, lengths, lengths.argmax()) if lengths.size else ""
+    words = _split_cached(text)
     if not words:
         return ""
     return max(words, key=len)
 
 def shortest_word(text):
     """Find the shortest word in text."""
-    words = text.split()
+    if len(text) >= _NUMPY_MIN_LENGTH and text.isascii():
+        starts, lengths = _ascii_word_spans(text)
+        return _word_at(text, starts, lengths, lengths.argmin()) if lengths.size else ""
+    words = _split_cached(text)
     if not words:
         return ""
     return min(words, key=len)
 
 def average_word_length(text):
     """Calculate average word length."""
-    words = text.split()
+    if len(text) >= _NUMPY_MIN_LENGTH and text.isascii():
+        _, lengths = _ascii_word_spans(text)
+        return int(lengths.sum()) / lengths.size if lengths.size else 0
+    words = _split_cached(text)
     if not words:
         return 0
-    return sum(len(word) for word in words) / len(words)
+    return sum(map(len, words)) / len(words)
+
+def word_statistics(text):
+    """Get word count, first/last/longest/shortest word and average word length in one call."""
+    long_ascii = len(text) >= _NUMPY_MIN_LENGTH and text.isascii()
+    if long_ascii:
+        starts, lengths = _ascii_word_spans(text)
+        count = int(lengths.size)
+    else:
+        words = _split_cached(text)
+        count = len(words)
+    if not count:
+        return {'word_count': 0, 'first_word': "", 'last_word': "",
+                'longest_word': "", 'shortest_word': "", 'average_word_length': 0}
+    if long_ascii:
+        return {
+            'word_count': count,
+            'first_word': _word_at(text, starts, lengths, 0),
+            'last_word': _word_at(text, starts, lengths, -1),
+            'longest_word': _word_at(text, starts, lengths, lengths.argmax()),
+            'shortest_word': _word_at(text, starts, lengths, lengths.argmin()),
+            'average_word_length': int(lengths.sum()) / count,
+        }
+    return {
+        'word_count': count,
+        'first_word': words[0],
+        'last_word': words[-1],
+        'longest_word': max(words, key=len),
+        'shortest_word': min(words, key=len),
+        'average_word_length': sum(map(len, words)) / count,
+    }
+
+def _word_counts(text):
+    """Count lowercased words with surrounding punctuation stripped."""
+    return Counter(map(str.strip, text.lower().split(), repeat(string.punctuation)))
 
 def word_frequency(text):
     """Count frequency of each word (returns dictionary)."""
-    words = text.lower().split()
-    frequency = {}
-    for word in words:
-        word = word.strip(string.punctuation)
-        frequency[word] = frequency.get(word, 0) + 1
-    return frequency
+    return dict(_word_counts(text))
 
 def most_frequent_word(text):
     """Find the most frequently occurring word."""
-    freq = word_frequency(text)
+    freq = _word_counts(text)
     if not freq:
         return ""
-    return max(freq, key=freq.get)
+    return freq.most_common(1)[0][0]
 
 def least_frequent_word(text):
     """Find the least frequently occurring word."""
-    freq = word_frequency(text)
+    freq = _word_counts(text)
     if not freq:
         return ""
+    # min() keeps the first-seen word on ties, unlike most_common()[-1]
     return min(freq, key=freq.get)
 
 def unique_words(text):
     """Get list of unique words."""
-    words = text.lower().split()
-    cleaned_words = [word.strip(string.punctuation) for word in words]
-    return list(set(cleaned_words))
+    return list(_word_counts(text))
 
 def count_unique_words(text):
     """Count number of unique words."""
-    return len(unique_words(text))
+    return len(_word_counts(text))
 
 # String validation functions
 def is_email(text):
     """Check if string is a valid email format."""
-    pattern = r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$'
-    return bool(re.match(pattern, text))
+    return _validate(_EMAIL_RE, _EMAIL_RE2, text)
 
 def is_phone_number(text):
     """Check if string is a valid phone number format."""
-    pattern = r'^\+?1?-?\.?\s?\(?(\d{3})\)?[-.\s]?(\d{3})[-.\s]?(\d{4})$'
-    return bool(re.match(pattern, text.strip()))
+    return _validate(_PHONE_RE, _PHONE_RE2, text.strip())
 
 def is_url(text):
     """Check if string is a valid URL format."""
-    pattern = r'^https?://(?:[-\w.])+(?:[:\d]+)?(?:/(?:[\w/_.])*(?:\?(?:[\w&=%.])*)?(?:#(?:\w)*)?)$'
-    return bool(re.match(pattern, text))
+    return _validate(_URL_RE, _URL_RE2, text)
 
 def contains_only_ascii(text):
     """Check if string contains only ASCII characters."""
-    try:
-        text.encode('ascii')
-        return True
-    except UnicodeEncodeError:
-        return False
+    return text.isascii()
 
 def is_blank(text):
     """Check if string is empty or contains only whitespace."""
-    return len(text.strip()) == 0 
\ No newline at end of file
+    return len(text.strip()) == 0
+
+
+# Tools exposed to the LLM, in the order they appear in the system prompt
+EXPORTS = {
+    'count_vowels': count_vowels,
+    'count_consonants': count_consonants,
+    'count_letters': count_letters,
+    'count_digits': count_digits,
+    'count_words': count_words,
+    'count_sentences': count_sentences,
+    'count_paragraphs': count_paragraphs,
+    'count_characters': count_characters,
+    'count_characters_no_spaces': count_characters_no_spaces,
+    'count_specific_char': count_specific_char,
+    'count_uppercase_letters': count_uppercase_letters,
+    'count_lowercase_letters': count_lowercase_letters,
+    'count_punctuation': count_punctuation,
+    'count_whitespace': count_whitespace,
+    'character_statistics': character_statistics,
+    'uppercase': uppercase,
+    'lowercase': lowercase,
+    'capitalize_first': capitalize_first,
+    'capitalize_words': capitalize_words,
+    'swap_case': swap_case,
+    'camel_case': camel_case,
+    'pascal_case': pascal_case,
+    'snake_case': snake_case,
+    'kebab_case': kebab_case,
+    'reverse_string': reverse_string,
+    'reverse_words': reverse_words,
+    'remove_spaces': remove_spaces,
+    'remove_whitespace': remove_whitespace,
+    'trim_whitespace': trim_whitespace,
+    'compress_whitespace': compress_whitespace,
+    'remove_punctuation': remove_punctuation,
+    'remove_digits': remove_digits,
+    'remove_letters': remove_letters,
+    'keep_only_letters': keep_only_letters,
+    'keep_only_digits': keep_only_digits,
+    'keep_only_alphanumeric': keep_only_alphanumeric,
+    'is_palindrome': is_palindrome,
+    'is_anagram': is_anagram,
+    'is_all_uppercase': is_all_uppercase,
+    'is_all_lowercase': is_all_lowercase,
+    'is_title_case': is_title_case,
+    'is_alphanumeric': is_alphanumeric,
+    'is_alphabetic': is_alphabetic,
+    'is_numeric': is_numeric,
+    'contains_substring': contains_substring,
+    'starts_with': starts_with,
+    'ends_with': ends_with,
+    'find_substring': find_substring,
+    'find_all_substrings': find_all_substrings,
+    'replace_substring': replace_substring,
+    'replace_first_occurrence': replace_first_occurrence,
+    'insert_at_position': insert_at_position,
+    'remove_substring': remove_substring,
+    'get_first_word': get_first_word,
+    'get_last_word': get_last_word,
+    'get_word_at_position': get_word_at_position,
+    'get_substring': get_substring,
+    'get_characters_at_positions': get_characters_at_positions,
+    'repeat_string': repeat_string,
+    'center_string': center_string,
+    'left_justify': left_justify,
+    'right_justify': right_justify,
+    'pad_left': pad_left,
+    'pad_right': pad_right,
+    'longest_word': longest_word,
+    'shortest_word': shortest_word,
+    'average_word_length': average_word_length,
+    'word_statistics': word_statistics,
+    'word_frequency': word_frequency,
+    'most_frequent_word': most_frequent_word,
+    'least_frequent_word': least_frequent_word,
+    'unique_words': unique_words,
+    'count_unique_words': count_unique_words,
+    'is_email': is_email,
+    'is_phone_number': is_phone_number,
+    'is_url': is_url,
+    'contains_only_ascii': contains_only_ascii,
+    'is_blank': is_blank,
+}